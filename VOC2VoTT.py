@@ -3,24 +3,79 @@ VOC2VoTT.py
 
 Creates a VoTT project and annotations from a Pascal VOC dataset.
 """
+import io
+import linecache
 import os
 import random
+import re
 import string
 import sys
+import tarfile
+import time
 import json
 import argparse
-import xml.etree.ElementTree as eT
+from json.encoder import encode_basestring_ascii
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from itertools import count, repeat
 from pathlib import Path
 from uuid import uuid1
 from tqdm import tqdm
 
+try:
+    from lxml import etree as eT
+except ImportError:
+    import xml.etree.ElementTree as eT
+
+# Value of a 'name' field in a .pbtxt label map, with its optional quotes stripped
+_TAG_NAME_RE = re.compile(r"""\bname\s*:\s*(?:'([^'\n]*)'|"([^"\n]*)"|([^\s'"}]+))""")
+
+# Readers for the name and the bounding box of an annotated object. With lxml they are XPaths compiled once,
+# the box is read in a single call as the string 'xmin ymin xmax ymax'
+if hasattr(eT, 'XPath'):
+    _find_name = eT.XPath('string(name)', smart_strings=False)
+    _find_box = eT.XPath("concat(bndbox/xmin, ' ', bndbox/ymin, ' ', bndbox/xmax, ' ', bndbox/ymax)",
+                         smart_strings=False)
+else:
+    def _find_name(object_):
+        return object_.findtext('name')
+
+    def _find_box(object_):
+        return ' '.join(object_.findtext(f'bndbox/{coord}') for coord in ('xmin', 'ymin', 'xmax', 'ymax'))
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    _truncate_boxes = None
+else:
+    @njit(cache=True)
+    def _truncate_boxes(boxes):
+        """
+        Returns an (N, 4) int32 array of the (N, 4) float64 array of boxes truncated towards zero
+        """
+        result = np.empty(boxes.shape, dtype=np.int32)
+        for i in range(boxes.shape[0]):
+            for j in range(4):
+                result[i, j] = int(boxes[i, j])
+        return result
+
 
 class VOC2VoTT:
     """
     Creates a VoTT project and annotations from a Pascal VOC dataset.
     """
 
-    def __init__(self, in_path, out_path, name):
+    def __init__(self, in_path, out_path, name, archive=None, pretty=False):
         """
         Initializes the VOC2VoTT converter
 
@@ -29,8 +84,13 @@ class VOC2VoTT:
         and the text file 'pascal_label_map.pbtxt'.
         out_path : Path to save VoTT project and annotations to.
         name : The name to give the created VoTT project.
+        archive : If 'jsonl' or 'tar', the annotations are packed into a single 'assets.jsonl' or 'assets.tar'
+        file instead of one file per asset.
+        pretty : Whether to indent the asset files. They are written compact by default, a JSONL archive is always
+        compact.
         """
-        # Define paths used by script
+        # Define paths used by script. The working directory is read once, relative paths are resolved against it
+        self._cwd = os.getcwd()
         self.in_path = in_path
         self.annotations_path = self._create_path(in_path, 'Annotations')
         self.images_path = self._create_path(in_path, 'JPEGImages')
@@ -56,6 +116,8 @@ class VOC2VoTT:
 
         self.out_path = out_path
         self.name = name
+        self.archive = archive
+        self.pretty = pretty and archive != 'jsonl'
 
     def convert(self):
         """
@@ -105,123 +167,125 @@ class VOC2VoTT:
 
         # Add tags.
         vott_data['assets'] = {}
-        vott_data['tags'] = []
-        for tag in self.tags_list:
-            vott_data["tags"].append(
-                {
-                    "name": tag,
-                    "color": self._hexcode(random.randint(40, 200), random.randint(40, 200),
-                                           random.randint(40, 200))
-                }
-            )
-
-        # Convert and add annotations.
-        listing = os.listdir(self.annotations_path)
-        listing.sort()
-        for idx, entry in enumerate(tqdm(listing)):
-            if entry.endswith(".xml"):
-                asset_data = self._read_data_from_xml(self._create_path(self.annotations_path, entry))
-                if asset_data is None:
-                    print(f'Failed to parse file: {self._create_path(self.annotations_path, entry)}', file=sys.stderr)
+        # Draw the color channels of every tag at once, in [40, 200]
+        if np is not None:
+            colors = np.random.randint(40, 201, size=(len(self.tags_list), 3)).tolist()
+        else:
+            channels = [40 + channel % 161 for channel in os.urandom(3 * len(self.tags_list))]
+            colors = [channels[i:i + 3] for i in range(0, len(channels), 3)]
+        vott_data['tags'] = [{"name": tag, "color": '#%02x%02x%02x' % tuple(color)}
+                             for tag, color in zip(self.tags_list, colors)]
+
+        # Convert and add annotations. Each annotation is independent, so spread them over worker processes.
+        # annotations_path is absolute, so the scanned entries already hold the full paths
+        with os.scandir(self.annotations_path) as listing:
+            xml_paths = [entry.path for entry in sorted((entry for entry in listing if entry.name.endswith(".xml")),
+                                                        key=lambda entry: entry.name)]
+        with ExitStack() as stack:
+            # Entered first so it is shut down last, the project file is written while everything else closes
+            vott_writer = stack.enter_context(ThreadPoolExecutor(max_workers=1))
+
+            archive = None
+            if self.archive is not None:
+                # A single archive amortizes the cost of creating a file over all of the assets
+                archive_dst = os.path.join(self.out_path, f'assets.{self.archive}')
+                try:
+                    archive = stack.enter_context(open(archive_dst, "wb", buffering=4 << 20))
+                    if self.archive == 'tar':
+                        archive = stack.enter_context(tarfile.open(fileobj=archive, mode='w|'))
+                except OSError:
+                    print(f'Error opening file {archive_dst}.', file=sys.stderr)
                     sys.exit(1)
 
-                if idx == 0:
-                    vott_data['lastVisitedAssetId'] = asset_data['asset']['id']
-                vott_data['assets'][asset_data['asset']['id']] = asset_data['asset']
-                filename = f"{asset_data['asset']['id']}-asset.json"
-                try:
-                    with open(os.path.join(self.out_path, filename), "w") as ov:
+            # The default worker count follows the CPU count and applies the Windows limit on workers
+            executor = stack.enter_context(ProcessPoolExecutor(initializer=_init_asset_ids))
+            results = executor.map(_convert_annotation, xml_paths, repeat(self.images_path),
+                                   repeat(None if archive is not None else self.out_path), repeat(self.pretty),
+                                   chunksize=32)
+            try:
+                for idx, (error, asset, asset_file) in enumerate(tqdm(results, total=len(xml_paths))):
+                    if error is not None:
+                        print(error, file=sys.stderr)
+                        sys.exit(1)
+
+                    asset_id = asset['id']
+                    if idx == 0:
+                        vott_data['lastVisitedAssetId'] = asset_id
+                    vott_data['assets'][asset_id] = asset
+                    if archive is not None:
                         try:
-                            json.dump(asset_data, ov, indent=4, sort_keys=True)
-                        except (TypeError, ValueError, RecursionError):
-                            print(f'Error writing JSON to {filename}.', filename, file=sys.stderr)
+                            self._add_to_archive(archive, asset_id, asset_file)
+                        except OSError:
+                            print(f'Error writing {asset_id} to the assets archive.', file=sys.stderr)
                             sys.exit(1)
+            except BaseException:
+                # map() has already submitted every annotation, drop what hasn't started instead of converting it
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+
+            if os.path.exists(vott_dst):
+                # If project file already exists, backup current version before writing.
+                print(f"{vott_dst} exists! Backing-up to {vott_dst + '.old'}")
+                try:
+                    if os.path.exists(vott_dst + '.old'):
+                        os.remove(vott_dst + '.old')  # Remove old backups, if necessary
+                    os.rename(vott_dst, vott_dst + '.old')
                 except OSError:
-                    print(f'Error opening file {filename}.', filename, file=sys.stderr)
+                    print(f'Error occurred backing-up project file.', file=sys.stderr)
                     sys.exit(1)
 
-        if os.path.exists(vott_dst):
-            # If project file already exists, backup current version before writing.
-            print(f"{vott_dst} exists! Backing-up to {vott_dst + '.old'}")
-            try:
-                if os.path.exists(vott_dst + '.old'):
-                    os.remove(vott_dst + '.old')  # Remove old backups, if necessary
-                os.rename(vott_dst, vott_dst + '.old')
-            except OSError:
-                print(f'Error occurred backing-up project file.', file=sys.stderr)
-                sys.exit(1)
-
-        # Write new .vott file
+            # Write new .vott file on a separate thread, overlapping the archive flush and the workers' shutdown
+            vott_written = vott_writer.submit(self._write_vott, vott_data, vott_dst)
+
         try:
-            with open(vott_dst, "w") as vott_file:
-                json.dump(vott_data, vott_file, indent=4, sort_keys=False)
+            vott_written.result()
         except OSError:
             print(f'Error occurred writing project file.', file=sys.stderr)
             sys.exit(1)
 
-    def _read_data_from_xml(self, path_to_xml):
+    @staticmethod
+    def _add_to_archive(archive, asset_id, asset_file):
         """
-        Returns a dictionary holding data structured as VoTT JSON annotations
+        Adds an asset file to the assets archive. A tar archive gets a '<id>-asset.json' member,
+        the same file VoTT reads, a JSONL archive gets the asset file as a line.
 
-        path_to_xml : Path to Pascal VOC .xml annotation file
+        archive : Open tar archive or binary JSONL file
+        asset_id : ID of the asset
+        asset_file : Content of the VoTT asset file as JSON bytes. Compact files are ASCII on a single line,
+        pretty ones (tar archive only) are indented UTF-8 over several lines
         """
-        results = {}
+        if isinstance(archive, tarfile.TarFile):
+            member = tarfile.TarInfo(f'{asset_id}-asset.json')
+            member.size = len(asset_file)
+            member.mtime = int(time.time())
+            archive.addfile(member, io.BytesIO(asset_file))
+        else:
+            archive.write(asset_file + b'\n')
 
-        try:
-            tree = eT.parse(path_to_xml)
-        except eT.ParseError as e:
-            return None
+    @staticmethod
+    def _write_vott(vott_data, vott_dst):
+        """
+        Writes the VoTT project file. The assets are streamed one compact entry per line
+        instead of serializing the whole project at once
 
-        root = tree.getroot()
-        xml_attr = {'path': self._create_path(self.images_path, root.find('filename').text), 'size': root.find('size')}
-        results['asset'] = {}
-        results['asset']['format'] = xml_attr['path'].split('.')[-1]
-        results['asset']['id'] = str(uuid1()).replace("-", "")
-        results['asset']['name'] = xml_attr['path'].split(os.sep)[-1]
-        results['asset']['path'] = "file:" + xml_attr['path'].replace("\\", "/")
-        results['asset']['size'] = {
-            "width": int(xml_attr['size'].find('width').text),
-            "height": int(xml_attr['size'].find('height').text)
-        }
-        results['asset']['state'] = 2
-        results['asset']['type'] = 1
-        results['regions'] = []
-        for object_ in root.findall('object'):
-            temp_region = {'id': self._generate_id(hyphen=False), 'type': "RECTANGLE",
-                           'tags': [object_.find('name').text]}
-            obj_bnd_box = object_.find('bndbox')
-            xmin = int(float(obj_bnd_box.find('xmin').text))  # Some exports give variables as floats
-            ymin = int(float(obj_bnd_box.find('ymin').text))
-            xmax = int(float(obj_bnd_box.find('xmax').text))
-            ymax = int(float(obj_bnd_box.find('ymax').text))
-
-            temp_region["boundingBox"] = {
-                "height": ymax - ymin,
-                "width": xmax - xmin,
-                "left": xmin,
-                "top": ymin
-            }
-            temp_region['points'] = [
-                {
-                    "x": xmin,
-                    "y": ymin
-                },
-                {
-                    "x": xmax,
-                    "y": ymin
-                },
-                {
-                    "x": xmax,
-                    "y": ymax
-                },
-                {
-                    "x": xmin,
-                    "y": ymax
-                }
-            ]
-            results['regions'].append(temp_region)
-        results['version'] = "2.2.0"
-        return results
+        vott_data : Dictionary holding the VoTT project
+        vott_dst : Path of the .vott file to write
+        """
+        with open(vott_dst, "wb", buffering=4 << 20) as vott_file:
+            vott_file.write(b'{')
+            for idx, (key, value) in enumerate(vott_data.items()):
+                vott_file.write(b',\n  ' if idx else b'\n  ')
+                vott_file.write(_to_json(key) + b': ')
+                if key == 'assets':
+                    vott_file.write(b'{')
+                    for asset_idx, (asset_id, asset) in enumerate(value.items()):
+                        vott_file.write(b',\n    ' if asset_idx else b'\n    ')
+                        vott_file.write(_to_json(asset_id) + b': ' + _to_json(asset))
+                    vott_file.write(b'\n  }')
+                else:
+                    # JSON strings can't hold raw newlines, so this only re-indents the nested structure
+                    vott_file.write(_to_json(value, indent=True).replace(b'\n', b'\n  '))
+            vott_file.write(b'\n}\n')
 
     @staticmethod
     def _get_tags(label_map_path):
@@ -232,47 +296,21 @@ class VOC2VoTT:
         """
         try:
             with open(label_map_path) as infile:
-                # Grab all lines that have tag names on it
-                lines = [line.strip() for line in infile.readlines() if 'name' in line]
+                data = infile.read()
         except OSError:
             return None
-        # Strip quotes off of the string and grab the name
-        return [line.replace("'", "").split()[-1] for line in lines]
+        # Grab the unquoted value of every name field in a single pass, only one of the quoting forms matches
+        return [''.join(groups) for groups in _TAG_NAME_RE.findall(data)]
 
-    @staticmethod
-    def _create_path(prefix, suffix):
+    def _create_path(self, prefix, suffix):
         """
         Returns a normalized absolute path
 
         prefix : Left hand side of the path
         suffix : Right hand side of the path
         """
-        path = os.path.join(prefix, suffix)
-        path = os.path.normpath(path)
-        path = os.path.abspath(path)
-        path = os.path.normpath(path)
-        return path
-
-    @staticmethod
-    def _hexcode(r=None, g=None, b=None):
-        """
-        Returns a string containing a hexcode. If a value for a channel is not
-        specified, a random value is chosen. Values outside of the range [0, 255]
-        are automatically clamped
-
-        r : Value for the red channel, if r=None a random value is picked
-        g : Value for the green channel, if g=None a random value is picked
-        b : Value for the blue channel, if b=None a random value is picked
-        """
-
-        def _chkarg(a):
-            # Handle unspecified and invalid values
-            if a is None:
-                a = random.randint(0, 255)
-            return int(max(0, min(a, 255)))
-
-        r, g, b = map(_chkarg, [r, g, b])
-        return '#{:02x}{:02x}{:02x}'.format(r, g, b)
+        # Same result as os.path.abspath without its getcwd() call, absolute prefixes discard self._cwd
+        return os.path.normpath(os.path.join(self._cwd, prefix, suffix))
 
     @staticmethod
     def _generate_id(hyphen=True):
@@ -290,6 +328,233 @@ class VOC2VoTT:
         return conn_id
 
 
+def _init_asset_ids():
+    """
+    Starts a new sequence of asset IDs for the current process. Called in every worker process,
+    forked workers would otherwise continue the parent's sequence and produce the same IDs
+    """
+    global _id_prefix, _id_counter
+    _id_prefix = uuid1().hex[:24]
+    _id_counter = count()
+
+
+def _new_asset_id():
+    """
+    Returns a new asset ID. Like a dashless uuid it has 32 hex characters, a uuid1 prefix unique
+    to the process followed by a counter
+    """
+    return _id_prefix + format(next(_id_counter), '08x')
+
+
+_init_asset_ids()
+
+
+def _to_json(obj, indent=False, sort_keys=False):
+    """
+    Returns obj serialized as UTF-8 JSON bytes. orjson is used when available, the standard
+    library otherwise. Both indent by 2 spaces so the output doesn't depend on what is installed
+
+    obj : Object to serialize
+    indent : Whether to pretty-print the output
+    sort_keys : Whether to sort the keys of dictionaries
+    """
+    if orjson is not None:
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, sort_keys=sort_keys, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), sort_keys=sort_keys, ensure_ascii=False).encode('utf-8')
+
+
+def _parse_boxes(raw_boxes):
+    """
+    Returns the bounding boxes as four parallel lists of integers (xmins, ymins, xmaxs, ymaxs)
+
+    raw_boxes : Lists of the [xmin, ymin, xmax, ymax] strings read from the annotation.
+    Some exports give variables as floats, those are truncated
+    """
+    if not raw_boxes:
+        return [], [], [], []
+    if _truncate_boxes is None:
+        return tuple(list(column) for column in zip(*([int(float(value)) for value in box] for box in raw_boxes)))
+    return tuple(column.tolist() for column in _truncate_boxes(np.array(raw_boxes, dtype=np.float64)).T)
+
+
+def _read_data_from_xml(path_to_xml, images_path):
+    """
+    Returns a dictionary holding data structured as VoTT JSON annotations. The regions are
+    stored as the parallel lists (ids, tags, xmins, ymins, xmaxs, ymaxs)
+
+    path_to_xml : Path to Pascal VOC .xml annotation file
+    images_path : Path to the folder holding the dataset images
+    """
+    xml_attr = {}
+    tags = []
+    raw_boxes = []
+
+    # Annotations are small, so the raw bytes are read in a single call and decoded by the parser itself
+    with open(path_to_xml, 'rb') as xml_file:
+        xml_data = xml_file.read()
+
+    # Stream through the annotation instead of building its whole tree, objects are dropped once read
+    try:
+        for _, elem in eT.iterparse(io.BytesIO(xml_data), events=('end',)):
+            if elem.tag == 'object':
+                tags.append(_find_name(elem))
+                raw_boxes.append(_find_box(elem).split())
+                elem.clear()
+            elif elem.tag in ('filename', 'width', 'height') and elem.tag not in xml_attr:
+                xml_attr[elem.tag] = elem.text
+    except eT.ParseError as e:
+        return None
+
+    # Regions are kept as parallel lists, they are only turned into JSON when the asset file is written
+    regions = ([VOC2VoTT._generate_id(hyphen=False) for _ in tags], tags) + _parse_boxes(raw_boxes)
+
+    # images_path is already absolute and normalized, so joining it is enough
+    path = os.path.normpath(os.path.join(images_path, xml_attr['filename']))
+
+    # Built as a single literal, the shape of an asset never changes
+    return {
+        'asset': {
+            'format': path.split('.')[-1],
+            'id': _new_asset_id(),
+            'name': path.split(os.sep)[-1],
+            'path': "file:" + path.replace("\\", "/"),
+            'size': {
+                "width": int(xml_attr['width']),
+                "height": int(xml_attr['height'])
+            },
+            'state': 2,
+            'type': 1
+        },
+        'regions': regions,
+        'version': "2.2.0"
+    }
+
+
+# Template of a region of a VoTT asset file, the shape of a rectangle region is fixed so it is formatted directly
+_REGION_TMPL = ('{"id":"%s","type":"RECTANGLE","tags":[%s],'
+                '"boundingBox":{"height":%d,"width":%d,"left":%d,"top":%d},'
+                '"points":[{"x":%d,"y":%d},{"x":%d,"y":%d},{"x":%d,"y":%d},{"x":%d,"y":%d}]}')
+
+# Fields of the asset entry of a VoTT asset file as (key, type) pairs, a nested tuple is an object
+_ASSET_SCHEMA = (
+    ('format', str),
+    ('id', str),
+    ('name', str),
+    ('path', str),
+    ('size', (('width', int), ('height', int))),
+    ('state', int),
+    ('type', int)
+)
+
+
+def _build_asset_serializer(schema):
+    """
+    Returns a function formatting asset data as a compact VoTT asset file, in ASCII JSON bytes.
+    Its source is generated from schema so every field is inlined into a single format string,
+    only strings go through the JSON string encoder
+
+    schema : Fields of the asset entry, see _ASSET_SCHEMA
+    """
+    formats = ['{"asset":{']
+    args = []
+
+    def _add_fields(fields, expr):
+        for idx, (key, kind) in enumerate(fields):
+            formats.append(f'{"," if idx else ""}"{key}":')
+            field_expr = f'{expr}[{key!r}]'
+            if isinstance(kind, tuple):
+                formats.append('{')
+                _add_fields(kind, field_expr)
+                formats.append('}')
+            elif kind is int:
+                formats.append('%d')
+                args.append(field_expr)
+            else:
+                formats.append('%s')
+                args.append(f'_encode({field_expr})')
+
+    _add_fields(schema, "asset_data['asset']")
+    formats.append('},"regions":[%s],"version":%s}')
+    args.append("','.join(_REGION_TMPL % (region_id, _encode(tag), ymax - ymin, xmax - xmin, xmin, ymin, "
+                "xmin, ymin, xmax, ymin, xmax, ymax, xmin, ymax) "
+                "for region_id, tag, xmin, ymin, xmax, ymax in zip(*asset_data['regions']))")
+    args.append("_encode(asset_data['version'])")
+
+    source = (
+        "def _serialize_asset(asset_data):\n"
+        f"    return ({''.join(formats)!r} % (\n"
+        + ''.join(f"        {arg},\n" for arg in args)
+        + "    )).encode('ascii')\n"
+    )
+    # Named and registered with linecache so tracebacks through the generated function show its source
+    filename = '<asset serializer>'
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    namespace = {'_encode': encode_basestring_ascii, '_REGION_TMPL': _REGION_TMPL}
+    exec(compile(source, filename, 'exec'), namespace)
+    return namespace['_serialize_asset']
+
+
+_serialize_asset = _build_asset_serializer(_ASSET_SCHEMA)
+
+
+def _format_asset_data(asset_data, pretty=False):
+    """
+    Returns the VoTT asset file of asset_data as UTF-8 JSON bytes
+
+    asset_data : Dictionary returned by _read_data_from_xml
+    pretty : Whether to indent the output and sort its keys, instead of writing it compact
+    """
+    if pretty:
+        regions = [
+            {
+                'id': region_id,
+                'type': "RECTANGLE",
+                'tags': [tag],
+                'boundingBox': {"height": ymax - ymin, "width": xmax - xmin, "left": xmin, "top": ymin},
+                'points': [{"x": xmin, "y": ymin}, {"x": xmax, "y": ymin}, {"x": xmax, "y": ymax},
+                           {"x": xmin, "y": ymax}]
+            }
+            for region_id, tag, xmin, ymin, xmax, ymax in zip(*asset_data['regions'])
+        ]
+        return _to_json({'asset': asset_data['asset'], 'regions': regions, 'version': asset_data['version']},
+                        indent=True, sort_keys=True)
+
+    return _serialize_asset(asset_data)
+
+
+def _convert_annotation(path_to_xml, images_path, out_path, pretty):
+    """
+    Converts a single annotation and writes its VoTT asset file. Runs in a worker process, so errors are
+    returned to the parent instead of exiting. Returns a tuple (error, asset, asset file), error is None on success
+    and the message to report otherwise, asset file is None if it was written to out_path
+
+    path_to_xml : Path to Pascal VOC .xml annotation file
+    images_path : Path to the folder holding the dataset images
+    out_path : Path to save the VoTT asset file to, if None the content of the file is returned instead
+    pretty : Whether to indent the asset file
+    """
+    asset_data = _read_data_from_xml(path_to_xml, images_path)
+    if asset_data is None:
+        return f'Failed to parse file: {path_to_xml}', None, None
+
+    asset_file = _format_asset_data(asset_data, pretty)
+    if out_path is None:
+        return None, asset_data['asset'], asset_file
+
+    filename = f"{asset_data['asset']['id']}-asset.json"
+    try:
+        with open(os.path.join(out_path, filename), "wb") as ov:
+            # Serialize up front so the file gets a single write() instead of one per token
+            ov.write(asset_file)
+    except OSError:
+        return f'Error opening file {filename}.', None, None
+
+    return None, asset_data['asset'], None
+
+
 def main():
     docstring = """
     Creates a VoTT project and annotations from a Pascal VOC dataset.
@@ -300,6 +565,11 @@ def main():
     parser.add_argument('--out_path', type=str, help='Path to save the VoTT project and annotations to',
                         required=False)
     parser.add_argument('--name', type=str, help='Name to give the created VoTT project', required=True)
+    parser.add_argument('--archive', type=str, choices=['jsonl', 'tar'],
+                        help='Pack the annotations into a single assets.jsonl or assets.tar file. VoTT can only '
+                             'open the project once the archive is unpacked into the output folder', required=False)
+    parser.add_argument('--pretty', action='store_true',
+                        help='Indent the annotation files instead of writing them compact')
     args = parser.parse_args()
 
     if args.in_path is None:
@@ -314,7 +584,9 @@ def main():
     voc2vott = VOC2VoTT(
         in_path=os.path.abspath(args.in_path),
         out_path=os.path.abspath(args.out_path),
-        name=args.name
+        name=args.name,
+        archive=args.archive,
+        pretty=args.pretty
     )
     voc2vott.convert()
 